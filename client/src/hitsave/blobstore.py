@@ -8,7 +8,7 @@ from hitsave.console import tape_progress, user_info
 from hitsave.session import Session
 from hitsave.util import (
     Current,
-    chunked_read,
+    chunked_readinto,
     datetime_to_string,
     human_size,
     datetime_now,
@@ -38,7 +38,7 @@ class BlobStatus(Enum):
 def get_digest_and_length(tape: IO[bytes]) -> Tuple[str, int]:
     content_length = 0
     h = blake3()
-    for data in chunked_read(tape):
+    for data in chunked_readinto(tape):
         content_length += len(data)
         h.update(data)
     digest = h.hexdigest()
@@ -119,7 +119,7 @@ class LocalBlobStore:
             cp = self.local_file_cache_path(digest)
             # [todo] exclusive file lock.
             with open(cp, "wb") as c:
-                for data in chunked_read(tape):
+                for data in chunked_readinto(tape):
                     c.write(data)
             # blobs are read only.
             # ref: https://stackoverflow.com/a/28492823/352201
@@ -342,7 +342,9 @@ class BlobStore(Current):
                 )
                 return info
             if status == BlobStatus.synced or status == BlobStatus.to_push:
-                logger.debug(f"Blob {digest[:10]} already present in local blob table.")
+                logger.debug(
+                    "Blob %s already present in local blob table.", digest[:10]
+                )
                 return info
             if x is None:
                 conn.execute(
@@ -238,9 +238,19 @@ class ExternalBinding(Binding):
 
 class CodeGraph:
     dg: DirectedGraph[Symbol, Any]
+    version: int
+    """ Incremented whenever a symbol is added to the graph. Use this to invalidate anything derived from the graph. """
+
+    bindings: Dict[Symbol, Binding]
+    """ The bindings that were resolved while exploring the graph.
+
+    ValueBindings are not kept, since a global can be reassigned at any point and needs rehashing.
+    """
 
     def __init__(self):
         self.dg = DirectedGraph()
+        self.version = 0
+        self.bindings = {}
 
     def eat_obj(self, o):
         v = Symbol.of_object(o)
@@ -251,12 +261,29 @@ class CodeGraph:
             # assume already explored
             return
         self.dg.add_vertex(v)
+        self.version += 1
         if isinstance(v, Symbol):
-            b = try_get_binding(v)
+            try:
+                b = self.get_binding(v)
+            except Exception as e:
+                internal_warning("Failed to resolve", v, " due to uncaught error\n", e)
+                b = UnresolvedBinding()
             for v2 in b.deps:
                 self.eat(v2)
                 self.dg.set_edge(v, v2, b)
 
+    def get_binding(self, v: Symbol) -> Binding:
+        """Returns the binding of ``v``, reusing the one found when ``v`` was added to the graph.
+
+        Bindings of values are resolved afresh on every call.
+        """
+        b = self.bindings.get(v)
+        if b is None:
+            b = get_binding(v)
+            if not isinstance(b, ValueBinding):
+                self.bindings[v] = b
+        return b
+
     def get_dependencies(self, v: Symbol):
         self.eat(v)
         yield from self.dg.reachable_from(v)
@@ -266,6 +293,8 @@ class CodeGraph:
 
     def clear(self):
         self.dg = DirectedGraph()
+        self.bindings = {}
+        self.version += 1
 
 
 @cache
@@ -456,15 +485,6 @@ def get_binding(s: Symbol) -> Binding:
         return ValueBinding.from_object(o)
 
 
-def try_get_binding(s: Symbol) -> Binding:
-    """get_binding wrapped in a try."""
-    try:
-        return get_binding(s)
-    except Exception as e:
-        internal_warning("Failed to resolve", s, " due to uncaught error\n", e)
-        return UnresolvedBinding()
-
-
 def get_digest(s: Symbol):
     return get_binding(s).digest
 
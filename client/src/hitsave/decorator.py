@@ -78,7 +78,7 @@ class SavedFunction(Generic[P, R]):
         pretty_args = Arg.create(sig, ba)
         fn_key = Symbol.of_object(self.func)
         deps = session.fn_deps(fn_key)
-        fn_hash = session.fn_hash(fn_key)
+        fn_hash = session.fn_hash(fn_key, deps)
         key = EvalKey(fn_key=fn_key, fn_hash=fn_hash, args_hash=args_hash)
         if key in self._cache:
             return self._cache[key]
@@ -95,7 +95,7 @@ class SavedFunction(Generic[P, R]):
                     )
                     self._fn_hashes_reported.add(fn_hash)
             else:
-                logger.debug(f"No stored value for {fn_key}: {result.reason}")
+                logger.debug("No stored value for %s: %s", fn_key, result.reason)
             start_time = datetime_now()
             start_process_time = time.process_time_ns()
             evalstore.start_eval(
@@ -116,14 +116,14 @@ class SavedFunction(Generic[P, R]):
                 result=result,
                 local_only=self.local_only,
             )
-            logger.debug(f"Computed value for {fn_key}.")
+            logger.debug("Computed value for %s.", fn_key)
             self._cache[key] = result
             return result
         else:
             if self.invocation_count == 1:
                 user_info(f"Found cache for", fn_key)
             else:
-                logger.debug(f"Found cached value for {fn_key}.")
+                logger.debug("Found cached value for %s.", fn_key)
             return result.value
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
@@ -269,7 +269,7 @@ class CloudEvalStore:
             return StoreMiss(msg)
         results: list = r.json()
         for result in results:
-            logger.debug(f"Found cloud eval for {key.fn_key}.")
+            logger.debug("Found cloud eval for %s.", key.fn_key)
             digest = result["content_hash"]  # [todo] will be renamed
             # [todo]; for now, blobs are always streamed, but in the future we will probably put small blobs inline.
             # we also don't store result blobs locally.
@@ -274,10 +274,8 @@ class DirectorySnapshot:
 
         files = sorted(rec(path), key=lambda x: x.relpath or 0)
         user_info(f"Directory snapshot created for {len(files)} files.")
-        h = blake3()
-        for file in files:
-            h.update(file.digest.encode())
-        digest = h.hexdigest()
+        # hash the concatenated file digests in one call.
+        digest = blake3("".join(file.digest for file in files).encode()).hexdigest()
         snap = cls(relpath=relpath, files=files, digest=digest, original_path=path)
         return snap
 
@@ -1,11 +1,29 @@
 import logging
-from typing import Callable, Dict, Set
-from hitsave.codegraph import Binding, CodeGraph, Symbol, ValueBinding, get_binding
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from hitsave.codegraph import Binding, CodeGraph, Symbol, ValueBinding
 from hitsave.config import Config
 from blake3 import blake3
 import uuid
 from hitsave.util import Current, digest_dictionary
 import sqlite3
+from pathlib import Path
+
+
+def connect_local_db(path: Path) -> sqlite3.Connection:
+    """Opens the local sqlite cache, tuned for the read-heavy lookup path.
+
+    WAL lets readers proceed while a write is in flight, and with ``synchronous=NORMAL``
+    a commit no longer fsyncs on every transaction; the database stays consistent,
+    at worst the last few commits are lost on power failure.
+    """
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA mmap_size={256 * 2**20}")
+    # negative cache_size is in KiB.
+    conn.execute("PRAGMA cache_size=-65536")
+    return conn
 
 
 class Session(Current):
@@ -14,28 +32,47 @@ class Session(Current):
     local_db: sqlite3.Connection
     codegraph: CodeGraph
     id: uuid.UUID
+    _fn_deps_cache: Dict[Symbol, Tuple[int, List[Symbol]]]
+    """ Cache of the dependencies of each symbol, keyed on the version of the codegraph they were computed with. """
 
     def __init__(self):
         cfg = Config.current()
 
-        self.local_db = sqlite3.connect(cfg.local_db_path)
+        self.local_db = connect_local_db(cfg.local_db_path)
         self.codegraph = CodeGraph()
         self.id = uuid.uuid4()
+        self._fn_deps_cache = {}
 
     @classmethod
     def default(cls):
         return cls()
 
-    def fn_hash(self, s: Symbol):
-        return digest_dictionary(
-            {
-                str(dep): get_binding(dep).digest
-                for dep in self.codegraph.get_dependencies(s)
-            }
-        )
+    def fn_hash(self, s: Symbol, deps: Optional[Dict[Symbol, Binding]] = None) -> str:
+        """Digest of ``s`` and its dependencies.
+
+        Pass ``deps`` when the result of ``fn_deps(s)`` is already at hand to avoid
+        resolving the bindings a second time."""
+        if deps is None:
+            deps = self.fn_deps(s)
+        # keyed on the string, distinct symbols can display the same (eg __main__).
+        digests = {str(dep): b.digest for dep, b in deps.items()}
+        return digest_dictionary(digests)
 
     def fn_deps(self, s: Symbol) -> Dict[Symbol, Binding]:
-        return {dep: get_binding(dep) for dep in self.codegraph.get_dependencies(s)}
+        """Returns the bindings of all of the symbols that ``s`` depends on, including ``s`` itself.
+
+        The set of dependencies is cached until the codegraph changes, but the bindings
+        are looked up on every call so that reassigned globals are rehashed.
+        """
+        self.codegraph.eat(s)
+        version = self.codegraph.version
+        c = self._fn_deps_cache.get(s)
+        if c is not None and c[0] == version:
+            syms = c[1]
+        else:
+            syms = list(dict.fromkeys(self.codegraph.get_dependencies(s)))
+            self._fn_deps_cache[s] = (version, syms)
+        return {dep: self.codegraph.get_binding(dep) for dep in syms}
 
     def deephash(self, obj):
         b = ValueBinding.from_object(obj)
@@ -44,6 +81,6 @@ class Session(Current):
             d.add(s)
             for ss in self.codegraph.get_dependencies(s):
                 d.add(ss)
-        dep_dict = {str(s): get_binding(s).digest for s in d}
-        dep_dict["___SELF___"] = b.digest
-        return digest_dictionary(dep_dict)
+        digests = {str(s): self.codegraph.get_binding(s).digest for s in d}
+        digests["___SELF___"] = b.digest
+        return digest_dictionary(digests)
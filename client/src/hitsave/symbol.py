@@ -57,8 +57,9 @@ def get_source(module_name: str) -> Optional[str]:
         internal_error("No source for", module_name)
         return None
     # [todo] assert it's a python file with ast etc.
-    with open(o, "rt") as f:
-        return f.read()
+    with open(o, "rb") as f:
+        # decode_source honours PEP 263 encoding declarations, same as the interpreter.
+        return importlib.util.decode_source(f.read())
 
 
 @cache
@@ -97,10 +98,10 @@ def module_name_of_file(path: str) -> Optional[str]:
     """
     path = os.path.abspath(path)
     # reference: https://stackoverflow.com/questions/897792/where-is-pythons-sys-path-initialized-from
-    ps = [p for p in sys.path]
-    ps.reverse()
-    for p in ps:
-        if p == "":
+    npath = os.path.normcase(path)
+    for p in reversed(sys.path):
+        # cheap prefix test first, commonpath splits both paths into components.
+        if p == "" or not npath.startswith(os.path.normcase(p)):
             continue
         if os.path.commonpath([p, path]) == p:
             r = os.path.relpath(path, p)
@@ -114,7 +115,10 @@ def module_name_of_file(path: str) -> Optional[str]:
 
 @dataclass
 class Symbol:
-    """Identifies a symbol for python objects."""
+    """Identifies a symbol for python objects.
+
+    Symbols should be treated as immutable, since their string form is cached.
+    """
 
     module_name: str
     decl_name: Optional[str] = field(default=None)
@@ -144,17 +148,21 @@ class Symbol:
         else:
             return self.module_name
 
-    def __hash__(self):
-        """Note this only hashes on the string value, not the binding."""
-        return hash(self.__str__())
-
-    def __str__(self):
+    @cached_property
+    def _str(self) -> str:
         module_name = self.display_module_name
         if self.decl_name is None:
             return module_name
         else:
             return f"{module_name}:{self.decl_name}"
 
+    def __hash__(self):
+        """Note this only hashes on the string value, not the binding."""
+        return hash(self._str)
+
+    def __str__(self):
+        return self._str
+
     def __rich__(self):
         """Pretty print with nice formatting."""
         module_name = self.display_module_name
@@ -1,4 +1,6 @@
-from dataclasses import asdict, dataclass, field, replace
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 import difflib
 from enum import Enum
 from typing import (
@@ -32,12 +34,21 @@ from hitsave.console import logger
 class EvalKey:
     """An EvalKey is a unique identifier for an evaluation"""
 
+    __slots__ = ("fn_key", "fn_hash", "args_hash")
+
     fn_key: Symbol
     fn_hash: str
     args_hash: str
 
     def tojson(self):
-        return json.dumps(asdict(self))
+        # built by hand rather than with asdict, which deep-copies every field.
+        fn_key = {
+            "module_name": self.fn_key.module_name,
+            "decl_name": self.fn_key.decl_name,
+        }
+        return json.dumps(
+            {"fn_key": fn_key, "fn_hash": self.fn_hash, "args_hash": self.args_hash}
+        )
 
     def __str__(self):
         return f"{repr(self.fn_key)}|{self.fn_hash}|{self.args_hash}"
@@ -46,7 +57,7 @@ class EvalKey:
         return self.__str__()
 
     def __hash__(self):
-        return hash(repr(self))
+        return hash((self.fn_key, self.fn_hash, self.args_hash))
 
 
 R = TypeVar("R")
@@ -114,11 +125,13 @@ class StoreMiss:
 # [todo] move this out of types.
 @dataclass
 class CodeChanged(StoreMiss):
-    _ALREADY_SEEN: ClassVar[Set[Tuple[str, str]]] = set()
+    _ALREADY_SEEN: ClassVar["OrderedDict[Tuple[str, str], None]"] = OrderedDict()
+    """ Diffs that have already been printed, so that each is only shown once. Least recently seen are dropped first. """
+    _ALREADY_SEEN_MAX: ClassVar[int] = 256
     old_deps: Optional[Dict[str, str]]
     new_deps: Optional[Dict[str, str]]
 
-    @property
+    @cached_property
     def reason(self):
         if self.old_deps is not None and self.new_deps is not None:
             lines = []
@@ -132,9 +145,13 @@ class CodeChanged(StoreMiss):
             if len(diff.mod) > 0:
                 for x, (v1, v2) in diff.mod.items():
                     lines.append(decorate("~~~ " + x, "yellow"))
-                    if (v1, v2) in CodeChanged._ALREADY_SEEN:
+                    seen = CodeChanged._ALREADY_SEEN
+                    if (v1, v2) in seen:
+                        seen.move_to_end((v1, v2))
                         continue
-                    CodeChanged._ALREADY_SEEN.add((v1, v2))
+                    seen[(v1, v2)] = None
+                    if len(seen) > CodeChanged._ALREADY_SEEN_MAX:
+                        seen.popitem(last=False)
                     lines += pp_diff(v1, v2)
             return "\n".join(lines)
 
@@ -144,5 +161,7 @@ class CodeChanged(StoreMiss):
 
 @dataclass
 class PollEvalResult:
+    __slots__ = ("value", "origin")
+
     value: Any
     origin: Literal["local", "cloud"]
@@ -1,5 +1,5 @@
-from contextvars import ContextVar
-from typing import List, TypeVar, Type
+from contextvars import ContextVar, Token
+from typing import List, Optional, TypeVar, Type
 
 T = TypeVar("T", bound="Current")
 
@@ -10,7 +10,10 @@ class Current:
     """
 
     CURRENT: ContextVar
-    _tokens: List
+    _token: Optional[Token]
+    """ Token for restoring CURRENT when leaving the innermost ``with`` block. """
+    _tokens: List[Token]
+    """ Tokens of the outer blocks, only used when the same instance is re-entered. """
 
     @classmethod
     def default(cls):
@@ -23,16 +26,21 @@ class Current:
         # ref: https://docs.python.org/3/reference/datamodel.html#object.__init_subclass__
 
     def __enter__(self):
-        if not hasattr(self, "_tokens"):
-            self._tokens = []
-        self._tokens.append(self.__class__.CURRENT.set(self))
+        token = self.__class__.CURRENT.set(self)
+        prev = getattr(self, "_token", None)
+        if prev is not None:
+            if not hasattr(self, "_tokens"):
+                self._tokens = []
+            self._tokens.append(prev)
+        self._token = token
         return self
 
     def __exit__(self, ex_type, ex_value, ex_trace):
-        assert hasattr(self, "_tokens")
-        assert len(self._tokens) > 0
-        t = self._tokens.pop()
+        t = getattr(self, "_token", None)
+        assert t is not None
         self.__class__.CURRENT.reset(t)
+        tokens = getattr(self, "_tokens", None)
+        self._token = tokens.pop() if tokens else None
 
     @classmethod
     def current(cls: Type[T]) -> T:
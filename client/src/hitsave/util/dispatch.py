@@ -1,3 +1,4 @@
+from abc import get_cache_token
 from typing import get_origin
 from functools import singledispatch, update_wrapper
 
@@ -9,7 +10,7 @@ def classdispatch(func):
     funcname = getattr(func, "__name__", "class dispatch function")
     sdfunc = singledispatch(func)
 
-    def dispatch(cls):
+    def resolve(cls):
         g = sdfunc.registry.get(cls)
         if g is not None:
             return g
@@ -24,14 +25,53 @@ def classdispatch(func):
         except Exception:
             return sdfunc.dispatch(object)
 
+    # cache of resolve(cls), cleared whenever a new implementation is registered.
+    resolved = {}
+    # only tracked once an abstract class is registered, since then `SomeABC.register(X)`
+    # can change how X resolves. Same trick as functools.singledispatch.
+    cache_token = None
+
+    def dispatch(cls):
+        nonlocal cache_token
+        if cache_token is not None:
+            token = get_cache_token()
+            if token != cache_token:
+                resolved.clear()
+                cache_token = token
+        try:
+            g = resolved.get(cls)
+        except TypeError:
+            # some type annotations are unhashable, these are resolved every time.
+            return resolve(cls)
+        if g is None:
+            g = resolve(cls)
+            resolved[cls] = g
+            orig = get_origin(cls)
+            if orig is not None and cls not in sdfunc.registry:
+                # eg List[int] and List[str] resolve the same as list.
+                resolved.setdefault(orig, g)
+        return g
+
     def wrapper(*args, **kwargs):
         if not args:
             raise TypeError(f"{funcname} requires at leat one positional argument.")
-        cls = args[0]
-        return dispatch(cls)(*args, **kwargs)
+        return dispatch(args[0])(*args, **kwargs)
+
+    def register(cls, func=None):
+        if func is None and isinstance(cls, type):
+            # used as a decorator; register once the function is given.
+            return lambda f: register(cls, f)
+        nonlocal cache_token
+        r = sdfunc.register(cls, func)
+        resolved.clear()
+        if cache_token is None and any(
+            hasattr(c, "__abstractmethods__") for c in sdfunc.registry
+        ):
+            cache_token = get_cache_token()
+        return r
 
-    for n in ["register", "registry"]:
-        setattr(wrapper, n, getattr(sdfunc, n))
+    setattr(wrapper, "register", register)
+    setattr(wrapper, "registry", sdfunc.registry)
     setattr(wrapper, "dispatch", dispatch)
     update_wrapper(wrapper, func)
     return wrapper
@@ -1,6 +1,5 @@
 from blake3 import blake3
 from dataclasses import dataclass, is_dataclass, Field, fields
-from itertools import filterfalse, tee
 from datetime import datetime, timezone
 from subprocess import check_output, CalledProcessError
 from typing import (
@@ -12,12 +11,12 @@ from typing import (
     Generic,
     Iterable,
     Iterator,
+    List,
     Set,
     Tuple,
     TypeVar,
 )
 from functools import partial
-import math
 import functools
 
 if hasattr(functools, "cache"):
@@ -35,11 +34,11 @@ def human_size(bytes: int, units=[" bytes", "KB", "MB", "GB", "TB", "PB", "EB"])
         return "1 byte"
     if bytes < (2**10):
         return str(bytes) + units[0]
-    ll = math.log2(bytes)
-    i = int(ll // 10)
+    # bit_length gives floor(log2(bytes)) + 1 exactly, without going through floats.
+    i = (bytes.bit_length() - 1) // 10
     if i >= len(units):
-        return "2^" + str(math.ceil(math.log2(bytes))) + " bytes"
-    f = bytes / (2 ** (i * 10))
+        return "2^" + str((bytes - 1).bit_length()) + " bytes"
+    f = bytes / (1 << (i * 10))
     return f"{f:.1f}{units[i]}"
 
 
@@ -50,12 +49,32 @@ def chunked_read(x: IO[bytes], block_size=2**20) -> Iterator[bytes]:
     return iter(partial(x.read, block_size), b"")
 
 
+def chunked_readinto(x: IO[bytes], block_size=2**20) -> Iterator[memoryview]:
+    """Same as ``chunked_read``, but reads every chunk into a single reused buffer.
+
+    Each chunk is only valid until the next one is requested, so the consumer must use
+    it straight away (eg hashing or writing it) rather than holding on to it.
+    Falls back to ``chunked_read`` if ``x`` has no ``readinto``.
+    """
+    if not hasattr(x, "readinto"):
+        yield from map(memoryview, chunked_read(x, block_size))
+        return
+    buf = memoryview(bytearray(block_size))
+    while True:
+        n = x.readinto(buf)
+        if not n:
+            return
+        yield buf[:n]
+
+
 X = TypeVar("X")
 Y = TypeVar("Y")
 
 
 @dataclass
 class DictDiff(Generic[X, Y]):
+    __slots__ = ("add", "rm", "mod")
+
     add: Set[str]
     rm: Set[str]
     mod: Dict[str, Tuple[X, Y]]
@@ -64,26 +83,39 @@ class DictDiff(Generic[X, Y]):
         return len(self.add) == 0 and len(self.rm) == 0 and len(self.mod) == 0
 
 
+_MISSING = object()
+
+
 def dict_diff(d1: Dict[str, X], d2: Dict[str, Y]) -> DictDiff[X, Y]:
-    k1 = set(d1.keys())
-    k2 = set(d2.keys())
-    return DictDiff(
-        add=k2.difference(k1),
-        rm=k1.difference(k2),
-        mod={k: (v1, d2[k]) for k, v1 in d1.items() if (k in d2) and (d2[k] != v1)},
-    )
+    add = set()
+    rm = set()
+    mod = {}
+    # classify each key of d1 with a single lookup in d2.
+    for k, v1 in d1.items():
+        v2 = d2.get(k, _MISSING)
+        if v2 is _MISSING:
+            rm.add(k)
+        elif v2 != v1:
+            mod[k] = (v1, v2)
+    for k in d2:
+        if k not in d1:
+            add.add(k)
+    return DictDiff(add=add, rm=rm, mod=mod)
 
 
 def partition(
     pred: Callable[[X], bool], iterable: Iterable[X]
-) -> Tuple[Iterable[X], Iterable[X]]:
+) -> Tuple[List[X], List[X]]:
     """Use a predicate to partition entries into false entries and true entries.
 
-    ref: https://docs.python.org/3/library/itertools.html
+    The predicate is called once per entry.
     """
     # partition(is_odd, range(10)) --> 0 2 4 6 8   and  1 3 5 7 9
-    t1, t2 = tee(iterable)
-    return filterfalse(pred, t1), filter(pred, t2)
+    falses: List[X] = []
+    trues: List[X] = []
+    for x in iterable:
+        (trues if pred(x) else falses).append(x)
+    return falses, trues
 
 
 def datetime_now() -> datetime:
@@ -101,22 +133,17 @@ def datetime_to_string(dt: datetime) -> str:
 
 def digest_string(x: str) -> str:
     """String to blake3 hex-digest"""
-    h = blake3()
-    h.update(x.encode())
-    return h.hexdigest()
+    return blake3(x.encode()).hexdigest()
 
 
 def digest_dictionary(d: Dict[str, str]):
-    h = blake3()
-    h.update(b"{")
+    parts = [b"{"]
     for k in sorted(d.keys()):
-        h.update(k.encode())
-        h.update(b":")
+        parts.append(k.encode())
+        parts.append(b":")
         v = d[k]
-        if isinstance(v, str):
-            v = v.encode()
-        assert isinstance(v, bytes)
-        h.update(v)
-        h.update(b",")
-    h.update(b"}")
-    return h.hexdigest()
+        parts.append(v.encode() if isinstance(v, str) else v)
+        parts.append(b",")
+    parts.append(b"}")
+    # one update call for the whole payload rather than four per item.
+    return blake3(b"".join(parts)).hexdigest()
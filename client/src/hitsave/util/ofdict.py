@@ -1,15 +1,50 @@
 from dataclasses import fields, is_dataclass
 from enum import Enum
 import json
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_type_hints,
+)
 
 from hitsave.util.dispatch import classdispatch
+from hitsave.util.misc import cache
 from hitsave.util.type_helpers import as_list, as_optional, is_optional
 
 JsonLike = Optional[Union[str, float, int, List["JsonLike"], Dict[str, "JsonLike"]]]
 
 T = TypeVar("T")
 
+_SCALARS = (float, str, int, bytes)
+
+
+@cache
+def _field_plan(A: Type) -> Tuple[Tuple[str, Any, bool], ...]:
+    """Returns ``(name, type, is_optional)`` for each field of the dataclass ``A``.
+
+    This only depends on the class, so we work it out once rather than on every ``ofdict`` call.
+    Fields annotated with strings (eg under ``from __future__ import annotations``) are resolved here too.
+    """
+    fs = fields(A)
+    hints = {}
+    if any(isinstance(f.type, str) for f in fs):
+        try:
+            hints = get_type_hints(A)
+        except Exception:
+            # unresolvable forward references are left as strings.
+            pass
+    plan = []
+    for f in fs:
+        t = hints.get(f.name, f.type) if isinstance(f.type, str) else f.type
+        plan.append((f.name, t, t is not None and is_optional(t)))
+    return tuple(plan)
+
 
 @classdispatch
 def ofdict(A: Type[T], a: JsonLike) -> T:
@@ -22,6 +57,9 @@ def ofdict(A: Type[T], a: JsonLike) -> T:
 
     Similar to ` cattrs.structure <https://cattrs.readthedocs.io/en/latest/structuring.html#what-you-can-structure-and-how/>`_.
     """
+    if type(a) is A and A in _SCALARS:
+        # most calls are for leaves that json already decoded to the right type.
+        return a
     if A is Any:
         return a  # type: ignore
     X = as_optional(A)
@@ -31,26 +69,24 @@ def ofdict(A: Type[T], a: JsonLike) -> T:
         else:
             return ofdict(X, a)
     if is_dataclass(A):
+        if not isinstance(a, dict):
+            raise TypeError(
+                f"Error while decoding dataclass {A}, expected a dict but got {a} : {type(a)}"
+            )
         d2 = {}
-        for f in fields(A):
-            if not isinstance(a, dict):
-                raise TypeError(
-                    f"Error while decoding dataclass {A}, expected a dict but got {a} : {type(a)}"
-                )
-            k = f.name
-            if k not in a:
-                if f.type is not None and is_optional(f.type):
-                    v = None
-                else:
-                    raise ValueError(f"Missing {f.name} on input dict. Decoding {A}.")
-            else:
+        for k, t, optional in _field_plan(A):
+            if k in a:
                 v = a[k]
-            if f.type is not None:
-                d2[k] = ofdict(f.type, v)
+            elif optional:
+                v = None
+            else:
+                raise ValueError(f"Missing {k} on input dict. Decoding {A}.")
+            if t is not None:
+                d2[k] = ofdict(t, v)
             else:
                 d2[k] = v
         return A(**d2)
-    if A in [float, str, int, bytes]:  # [todo] etc
+    if A in _SCALARS:  # [todo] etc
         if isinstance(a, A):
             return a
         else:
@@ -65,6 +101,9 @@ def _list_ofdict(A, a):
         raise TypeError(f"Expected a list but got a {type(a)}")
     X = as_list(A)
     if X is not None:
+        if X in _SCALARS and all(isinstance(y, X) for y in a):
+            # json.loads already produced the right scalars, so skip the per-item dispatch.
+            return list(a)
         return [ofdict(X, y) for y in a]
     else:
         return a
@@ -109,10 +148,7 @@ def validate(t: Type, item) -> bool:
     if isinstance(item, t):
         if is_dataclass(item):
             return all(
-                [
-                    validate(field.type, getattr(item, field.name))
-                    for field in fields(item)
-                ]
+                [validate(ft, getattr(item, k)) for k, ft, _ in _field_plan(type(item))]
             )
         return True
     raise NotImplementedError(f"Don't know how to validate {t}")
@@ -129,10 +165,9 @@ class MyJsonEncoder(json.JSONEncoder):
             return o.value
         if is_dataclass(o):
             r = {}
-            for field in fields(o):
-                k = field.name
+            for k, _, optional in _field_plan(type(o)):
                 v = getattr(o, k)
-                if is_optional(field.type) and v is None:
+                if optional and v is None:
                     continue
                 r[k] = v
             return r
@@ -17,6 +17,24 @@ from typing import (
     Union,
     List,
 )
+import functools
+
+from hitsave.util.misc import cache
+
+
+def _cache_on_type(f):
+    """Like ``cache``, but falls back to calling ``f`` directly when the type is unhashable."""
+    cached = cache(f)
+
+    @functools.wraps(f)
+    def wrapper(T):
+        try:
+            hash(T)
+        except TypeError:
+            return f(T)
+        return cached(T)
+
+    return wrapper
 
 
 def is_optional(T: Type) -> bool:
@@ -24,6 +42,7 @@ def is_optional(T: Type) -> bool:
     return as_optional(T) is not None
 
 
+@_cache_on_type
 def as_optional(T: Type) -> Optional[Type]:
     """If we have ``T == Optional[X]``, returns ``X``, otherwise returns ``None``.
 
@@ -31,6 +50,9 @@ def as_optional(T: Type) -> Optional[Type]:
     we have ``as_optional(Optional[Optional[X]]) ↝ X``
     ref: https://stackoverflow.com/questions/56832881/check-if-a-field-is-typing-optional
     """
+    if isinstance(T, type):
+        # plain classes like int or str are the common case and are never optional.
+        return None
     if get_origin(T) is Union:
         args = get_args(T)
         if type(None) in args:
@@ -44,6 +66,7 @@ def as_optional(T: Type) -> Optional[Type]:
     return None
 
 
+@_cache_on_type
 def as_list(T: Type) -> Optional[Type]:
     """If `T = List[X]`, return `X`, otherwise return None."""
     if get_origin(T) is list:
@@ -1,5 +1,7 @@
 from pathlib import Path
 from hitsave.config import Config
+from hitsave.session import Session
+from hitsave.symbol import Symbol
 
 
 def test_config_workspace_dir():
@@ -12,3 +14,49 @@ def test_config_local_cache_path():
     d = Config.current().local_cache_dir
     assert isinstance(d, Path)
     assert d.exists()
+
+
+def _plus_one(x):
+    return x + 1
+
+
+_K = [1, 2]
+
+
+def _plus_k(x):
+    return x + len(_K)
+
+
+def test_fn_hash_cache():
+    session = Session()
+    s = Symbol.of_object(_plus_one)
+    h = session.fn_hash(s)
+    entry = session._fn_deps_cache[s]
+    session.fn_deps(s)
+    assert session._fn_deps_cache[s] is entry
+    v = session.codegraph.version
+    session.codegraph.clear()
+    assert session.codegraph.version > v
+    assert session.fn_hash(s) == h
+    assert session._fn_deps_cache[s] is not entry
+    assert session._fn_deps_cache[s][0] == session.codegraph.version
+    entry = session._fn_deps_cache[s]
+    v = session.codegraph.version
+    session.codegraph.eat(Symbol.of_object(_plus_k))
+    assert session.codegraph.version > v
+    session.fn_deps(s)
+    assert session._fn_deps_cache[s] is not entry
+
+
+def test_fn_hash_global_reassigned():
+    global _K
+    session = Session()
+    s = Symbol.of_object(_plus_k)
+    old_k = _K
+    h = session.fn_hash(s)
+    try:
+        _K = [5, 6]
+        assert session.fn_hash(s) != h
+    finally:
+        _K = old_k
+    assert session.fn_hash(s) == h
@@ -1,5 +1,6 @@
 from dataclasses import dataclass, asdict
-from typing import List
+from typing import List, Optional
+import pytest
 from test.deepeq import deepeq
 from hitsave.util import ofdict
 
@@ -22,3 +23,37 @@ def test_foo():
     y = asdict(x)
     z = ofdict(Foo, y)
     assert deepeq(x, z)
+
+
+@dataclass
+class Baz:
+    bar: Bar
+    note: Optional[str]
+
+
+def test_optional_missing():
+    z = ofdict(Baz, {"bar": {"cheese": 1, "toast": "x"}})
+    assert deepeq(z, Baz(Bar(1, "x"), None))
+    with pytest.raises(ValueError):
+        ofdict(Baz, {"note": "x"})
+    with pytest.raises(TypeError):
+        ofdict(Baz, [1, 2])
+
+
+def test_scalar_list():
+    xs = [1, 2, 3]
+    ys = ofdict(List[int], xs)
+    assert ys == xs and ys is not xs
+    with pytest.raises(TypeError):
+        ofdict(List[int], [1, "2"])
+
+
+@dataclass
+class Forward:
+    bars: "List[Bar]"
+    note: "Optional[str]"
+
+
+def test_string_annotations():
+    z = ofdict(Forward, {"bars": [{"cheese": 1, "toast": "x"}]})
+    assert deepeq(z, Forward([Bar(1, "x")], None))
@@ -1,13 +1,18 @@
 from dataclasses import dataclass, fields
+import io
 from pathlib import Path
 from typing import List, Optional, Union
 from hitsave.config import get_git_root
 from hitsave.util import (
     Current,
+    classdispatch,
     as_list,
+    dict_diff,
     human_size,
     is_optional,
     as_optional,
+    chunked_read,
+    chunked_readinto,
 )
 from pytest import raises
 
@@ -117,3 +122,68 @@ def test_get_root_no_output(tmp_path, capfd):
     out, err = capfd.readouterr()
     assert out == ""
     assert err == ""
+
+
+def test_classdispatch_register_after_call():
+    @classdispatch
+    def f(A):
+        return "default"
+
+    assert f(List[int]) == "default"
+    assert f(int) == "default"
+
+    @f.register(list)
+    def _f_list(A):
+        return "list"
+
+    @f.register
+    def _f_int(A: int):
+        return "int"
+
+    assert f(List[int]) == "list"
+    assert f(int) == "int"
+    assert f(str) == "default"
+
+
+def test_dict_diff():
+    diff = dict_diff({"a": "1", "b": "2", "c": "3"}, {"b": "2", "c": "4", "d": "5"})
+    assert diff.add == {"d"}
+    assert diff.rm == {"a"}
+    assert diff.mod == {"c": ("3", "4")}
+    assert dict_diff({"a": "1"}, {"a": "1"}).is_empty()
+
+
+def test_chunked_readinto():
+    data = bytes(range(256)) * 10
+
+    class NoReadinto:
+        def __init__(self):
+            self.f = io.BytesIO(data)
+
+        def read(self, n):
+            return self.f.read(n)
+
+    for f in [io.BytesIO(data), NoReadinto()]:
+        chunks = [bytes(c) for c in chunked_readinto(f, block_size=1000)]
+        assert [len(c) for c in chunks] == [1000, 1000, 560]
+        assert b"".join(chunks) == data
+    assert list(chunked_read(io.BytesIO(data), 1000)) == chunks
+
+
+def test_classdispatch_abc_register():
+    from collections.abc import Sequence
+
+    @classdispatch
+    def f(A):
+        return "default"
+
+    @f.register(Sequence)
+    def _f_seq(A):
+        return "seq"
+
+    class X:
+        pass
+
+    assert f(X) == "default"
+    Sequence.register(X)
+    assert f(X) == "seq"